@@ -26,6 +26,7 @@ class AppSettings(BaseSettings):
     # --- Application General Settings ---
     APP_NAME: str = "Iceberg Data Lakehouse API"
     ENVIRONMENT: str = Field("development", env="APP_ENV") # Can be 'development', 'production', etc.
+    LOG_LEVEL: str = Field("INFO", env="LOG_LEVEL")
 
     # --- Nessie Catalog Configuration ---
     # The name of the catalog to use from pyiceberg.yaml
@@ -43,10 +44,32 @@ class AppSettings(BaseSettings):
     # This is the bucket name where Iceberg tables will store their data files
     ICEBERG_WAREHOUSE_BUCKET: str = Field("iceberg-warehouse", env="ICEBERG_WAREHOUSE_BUCKET")
 
+    # --- Iceberg Table Metadata Cache ---
+    # Loaded table handles are reused by reads and writes for up to the TTL, saving a catalog
+    # load_table round-trip per request. Writes through this process are visible immediately;
+    # commits from other processes (Trino, other workers) can be missed by reads for up to the TTL.
+    TABLE_CACHE_SIZE: int = Field(128, env="TABLE_CACHE_SIZE")
+    TABLE_CACHE_TTL_SECONDS: float = Field(30.0, env="TABLE_CACHE_TTL_SECONDS")
+
+    # --- Read Response Cache ---
+    # How long a serialized GET /data body is reused; 0 disables the cache. The cache is per process:
+    # writes through this worker invalidate it, but writes through other UVICORN_WORKERS or other
+    # processes (Trino) are not seen until the entry expires.
+    DATA_RESPONSE_CACHE_TTL_SECONDS: float = Field(1.0, env="DATA_RESPONSE_CACHE_TTL_SECONDS")
+    # Upper bound on memory held by cached bodies (plain + gzipped); larger responses are not cached
+    DATA_RESPONSE_CACHE_MAX_BYTES: int = Field(8 * 1024 * 1024, env="DATA_RESPONSE_CACHE_MAX_BYTES")
+
+    # --- Request Handling ---
+    # Upper bound on concurrently running data read/write requests (each holds Arrow buffers in memory)
+    MAX_CONCURRENT_DATA_REQUESTS: int = Field(64, env="MAX_CONCURRENT_DATA_REQUESTS")
+
     # --- Uvicorn Server Settings (if needed in config, otherwise in uvicorn command) ---
     UVICORN_HOST: str = Field("0.0.0.0", env="UVICORN_HOST")
     UVICORN_PORT: int = Field(8000, env="UVICORN_PORT")
     UVICORN_RELOAD: bool = Field(True, env="UVICORN_RELOAD") # Good for development
+    UVICORN_WORKERS: int = Field(1, env="UVICORN_WORKERS") # Ignored by uvicorn when reload is enabled
+    UVICORN_ACCESS_LOG: bool = Field(False, env="UVICORN_ACCESS_LOG") # Per-request access logging costs CPU
+    UVICORN_TIMEOUT_KEEP_ALIVE: int = Field(30, env="UVICORN_TIMEOUT_KEEP_ALIVE") # Seconds idle connections stay open for reuse
 
     # Pydantic Settings configuration
     model_config = SettingsConfigDict(
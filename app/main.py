@@ -1,31 +1,46 @@
 # app/main.py
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+import asyncio
+import gzip
+import io
 import logging
 import os
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager # <--- Import this!
+from typing import Callable
 
 # Assuming you'll have a config.py to manage settings
 from .config import load_app_config, AppSettings # Import the loading function
 
 # Import your services
 from .services import NessieService, IcebergService, MinioService
+from .utils.helpers import build_row_filter, dumps_json, start_queue_logging, LakehouseJSONResponse
 
 # Define your example schema and table identifier (as in previous example)
-from pyiceberg.schema import Schema, StructType, NestedField
+from pyiceberg.schema import Schema, NestedField
 from pyiceberg.types import StringType, TimestampType, DoubleType
-import pandas as pd
+import pyarrow as pa
 import datetime
 
 EXAMPLE_SCHEMA = Schema(
-    StructType(
-        NestedField(1, "id", StringType(), required=True),
-        NestedField(2, "value", DoubleType(), required=False),
-        NestedField(3, "timestamp", TimestampType(), required=True)
-    )
+    NestedField(1, "id", StringType(), required=True),
+    NestedField(2, "value", DoubleType(), required=False),
+    NestedField(3, "timestamp", TimestampType(), required=True)
 )
 EXAMPLE_TABLE_IDENTIFIER = "default.my_fastapi_table"
 
+# Static response bodies, serialized once at import instead of per request
+ROOT_RESPONSE = dumps_json({"message": "Welcome to the Iceberg Data Lakehouse API!"})
+WRITE_SUCCESS_RESPONSE = dumps_json({"status": "success", "message": f"Data appended to {EXAMPLE_TABLE_IDENTIFIER}"})
+DATA_RESPONSE_CACHE_SIZE = 32
+# Bodies below this size are sent uncompressed (shared by GZipMiddleware and the GET /data cache)
+GZIP_MINIMUM_SIZE = 1024
+
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +52,101 @@ app_config: AppSettings = None
 nessie_service_instance: NessieService = None
 minio_service_instance: MinioService = None
 iceberg_service_instance: IcebergService = None
+data_request_semaphore: asyncio.Semaphore = None
+# Serialized health payload; static once the catalog is loaded, so built on the first successful check
+health_response: bytes = None
+# Pre-serialized GET /data bodies: (columns, filters, limit) -> (created_at, body, gzipped body or None).
+# Kept in creation order, so expired entries are always at the front.
+data_response_cache: OrderedDict[tuple, tuple[float, bytes, bytes | None]] = OrderedDict()
+data_response_cache_bytes: int = 0
+# Bumped on every local write so reads that started before the write don't repopulate the cache
+data_generation: int = 0
+
+
+def check_read_request(table, row_filter, selected_fields: tuple[str, ...]):
+    # Client mistakes (unknown columns, filter values of the wrong type) become a 400 instead of a scan failure and a 500
+    try:
+        iceberg_service_instance.validate_selected_fields(table, selected_fields)
+        iceberg_service_instance.validate_row_filter(table, row_filter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def invalidate_data_cache():
+    global data_generation, data_response_cache_bytes
+    data_generation += 1
+    data_response_cache.clear()
+    data_response_cache_bytes = 0
+
+
+def prune_data_cache(now: float):
+    # Drops expired entries, then the oldest ones until both the entry and byte limits hold
+    global data_response_cache_bytes
+    while data_response_cache:
+        created_at, body, gzipped = next(iter(data_response_cache.values()))
+        if (
+            now - created_at < app_config.DATA_RESPONSE_CACHE_TTL_SECONDS
+            and len(data_response_cache) <= DATA_RESPONSE_CACHE_SIZE
+            and data_response_cache_bytes <= app_config.DATA_RESPONSE_CACHE_MAX_BYTES
+        ):
+            break
+        data_response_cache.popitem(last=False)
+        data_response_cache_bytes -= len(body) + len(gzipped or b"")
+
+
+def encode_data_response(records: list[dict], compress: bool) -> tuple[bytes, bytes | None]:
+    # Runs in a worker thread; the gzipped copy lets cache hits skip GZipMiddleware's per-request compression
+    body = dumps_json({"data": records})
+    gzipped = gzip.compress(body) if compress and len(body) >= GZIP_MINIMUM_SIZE else None
+    return body, gzipped
+
+
+def data_body_response(request: Request, body: bytes, gzipped: bytes | None) -> Response:
+    if gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        # GZipMiddleware passes responses that already set Content-Encoding through untouched
+        return Response(
+            content=gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(content=body, media_type="application/json")
+
+
+async def open_batch_stream(row_filter, selected_fields: tuple[str, ...], limit: int | None) -> tuple[pa.RecordBatchReader, Callable[[], None]]:
+    """
+    Takes a data-request slot and opens a streaming scan over the example table.
+    Unknown columns and invalid filters raise HTTPException(400); other planning errors are raised here too, before a response starts.
+    The returned release() closes the reader and frees the slot; it is idempotent so it can run both
+    from the stream's finally block and from the response's background task (streams that never start).
+    """
+    await data_request_semaphore.acquire()
+    reader = None
+    released = False
+
+    def release():
+        nonlocal released
+        if released:
+            return
+        released = True
+        if reader is not None:
+            reader.close()
+        data_request_semaphore.release()
+
+    try:
+        table = await asyncio.to_thread(iceberg_service_instance.load_iceberg_table, EXAMPLE_TABLE_IDENTIFIER)
+        check_read_request(table, row_filter, selected_fields)
+        reader = await asyncio.to_thread(
+            iceberg_service_instance.read_batches,
+            table,
+            row_filter=row_filter,
+            selected_fields=selected_fields,
+            limit=limit
+        )
+    except Exception:
+        release()
+        raise
+    return reader, release
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,131 +155,361 @@ async def lifespan(app: FastAPI):
     Code before 'yield' runs on startup.
     Code after 'yield' runs on shutdown.
     """
-    global app_config, nessie_service_instance, minio_service_instance, iceberg_service_instance
+    global app_config, nessie_service_instance, minio_service_instance, iceberg_service_instance, data_request_semaphore
 
     # --- Startup Logic ---
-    logger.info("Application startup event triggered. Initializing services...")
-
     # 1. Load configuration
     app_config = load_app_config()
-    logger.info("Application configuration loaded.")
-
-    # 2. Initialize MinIO Service
-    minio_service_instance = MinioService(
-        endpoint_url=app_config.MINIO_ENDPOINT,
-        access_key=app_config.MINIO_ACCESS_KEY,
-        secret_key=app_config.MINIO_SECRET_KEY,
-        region_name=app_config.MINIO_REGION
-    )
-    # Ensure MinIO warehouse bucket exists
+    app.title = app_config.APP_NAME
+
+    # Log records are enqueued by handlers and written by a single listener thread
+    log_listener = start_queue_logging(app_config.LOG_LEVEL)
     try:
-        minio_service_instance.create_bucket_if_not_exists(app_config.ICEBERG_WAREHOUSE_BUCKET)
+        logger.info("Application startup event triggered. Initializing services...")
+        logger.info("Application configuration loaded.")
+
+        # 2. Initialize MinIO Service
+        minio_service_instance = MinioService(
+            endpoint_url=app_config.MINIO_ENDPOINT,
+            access_key=app_config.MINIO_ACCESS_KEY,
+            secret_key=app_config.MINIO_SECRET_KEY,
+            region_name=app_config.MINIO_REGION
+        )
+
+        # 3. Initialize Nessie Service
+        nessie_service_instance = NessieService(
+            catalog_name=app_config.NESSIE_CATALOG_NAME,
+            config_file_path=app_config.PYICEBERG_CONFIG_PATH
+        )
+        logger.info(f"Nessie Service initialized for catalog '{app_config.NESSIE_CATALOG_NAME}'.")
+
+        # 4. Initialize Iceberg Service
+        iceberg_service_instance = IcebergService(
+            nessie_service=nessie_service_instance,
+            table_cache_size=app_config.TABLE_CACHE_SIZE,
+            table_cache_ttl_seconds=app_config.TABLE_CACHE_TTL_SECONDS
+        )
+        logger.info("Iceberg Service initialized.")
+
+        # 5. Ensure the MinIO warehouse bucket exists and warm the Nessie catalog.
+        # The two round-trips are independent, so run them concurrently rather than back to back.
+        bucket_result, catalog_result = await asyncio.gather(
+            asyncio.to_thread(minio_service_instance.create_bucket_if_not_exists, app_config.ICEBERG_WAREHOUSE_BUCKET),
+            asyncio.to_thread(iceberg_service_instance.get_catalog),
+            return_exceptions=True
+        )
+        if isinstance(bucket_result, Exception):
+            logger.error(f"Failed to ensure Minio bucket on startup: {bucket_result}")
+            # It's critical to have the bucket, so raise to prevent app start
+            raise RuntimeError("Failed to connect to MinIO on startup. Check MinIO service and credentials.") from bucket_result
         logger.info(f"MinIO warehouse bucket '{app_config.ICEBERG_WAREHOUSE_BUCKET}' ensured.")
-    except Exception as e:
-        logger.error(f"Failed to ensure Minio bucket on startup: {e}")
-        # It's critical to have the bucket, so raise to prevent app start
-        raise RuntimeError("Failed to connect to MinIO on startup. Check MinIO service and credentials.") from e
-
-    # 3. Initialize Nessie Service
-    nessie_service_instance = NessieService(
-        catalog_name=app_config.NESSIE_CATALOG_NAME,
-        config_file_path=app_config.PYICEBERG_CONFIG_PATH
-    )
-    logger.info(f"Nessie Service initialized for catalog '{app_config.NESSIE_CATALOG_NAME}'.")
-
-    # 4. Initialize Iceberg Service
-    iceberg_service_instance = IcebergService(
-        nessie_service=nessie_service_instance
-    )
-    logger.info("Iceberg Service initialized.")
-
-    # You can also store these instances on app.state for access in dependencies if preferred
-    app.state.minio_service = minio_service_instance
-    app.state.nessie_service = nessie_service_instance
-    app.state.iceberg_service = iceberg_service_instance
-
-    logger.info("Application startup complete. Ready to serve requests.")
-
-    yield # This is where the application starts receiving requests
-
-    # --- Shutdown Logic (code after yield) ---
-    logger.info("Application shutdown event triggered. Cleaning up resources...")
-    # Add any cleanup logic here if necessary
-    # For services like Minio/Nessie/Iceberg, there might not be explicit 'close' methods
-    # unless you establish persistent connections that need closing.
-    # In this specific case, our services are mostly stateless or handle connections internally
-    # on demand, so explicit cleanup here might not be strictly necessary,
-    # but for DB connections, etc., this is where you'd close them.
-    logger.info("Application shutdown complete.")
+        if isinstance(catalog_result, Exception):
+            # Not fatal: the catalog is loaded lazily again on first use and reported by /health
+            logger.warning(f"Could not preload Nessie catalog on startup: {catalog_result}")
+
+        # 6. Bound concurrent data requests so a burst can't allocate unbounded Arrow buffers
+        data_request_semaphore = asyncio.Semaphore(app_config.MAX_CONCURRENT_DATA_REQUESTS)
+
+        # You can also store these instances on app.state for access in dependencies if preferred
+        app.state.minio_service = minio_service_instance
+        app.state.nessie_service = nessie_service_instance
+        app.state.iceberg_service = iceberg_service_instance
+
+        logger.info("Application startup complete. Ready to serve requests.")
+
+        yield # This is where the application starts receiving requests
+
+        # --- Shutdown Logic (code after yield) ---
+        logger.info("Application shutdown event triggered. Cleaning up resources...")
+        # Add any cleanup logic here if necessary
+        # For services like Minio/Nessie/Iceberg, there might not be explicit 'close' methods
+        # unless you establish persistent connections that need closing.
+        # In this specific case, our services are mostly stateless or handle connections internally
+        # on demand, so explicit cleanup here might not be strictly necessary,
+        # but for DB connections, etc., this is where you'd close them.
+        logger.info("Application shutdown complete.")
+    finally:
+        # Runs even if startup fails, so queued records are flushed and the handler detached
+        log_listener.stop()
 
 # --- FastAPI Application ---
 # Pass the lifespan context manager to the FastAPI app
-app = FastAPI(title=app_config.APP_NAME if 'app_config' in locals() else "Iceberg Data Lakehouse App", lifespan=lifespan)
+# JSON routes return bodies already encoded with dumps_json, so payloads skip jsonable_encoder;
+# LakehouseJSONResponse stays the default so any route returning a dict still encodes with orjson
+app = FastAPI(
+    # Settings are only loaded in the lifespan; it replaces this default with the configured APP_NAME
+    title=AppSettings.model_fields["APP_NAME"].default,
+    lifespan=lifespan,
+    default_response_class=LakehouseJSONResponse
+)
+# Record payloads repeat every column name per row and compress well; skip tiny responses
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
 
 
 @app.get("/")
 async def read_root():
-    return {"message": "Welcome to the Iceberg Data Lakehouse API!"}
+    return Response(content=ROOT_RESPONSE, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     # Simple health check, could be extended to check connections
     # Access services via global instances for simple use cases
     # For more complex apps, use FastAPI's Depends with a callable that returns the service
+    global health_response
+    if health_response is not None:
+        return Response(content=health_response, media_type="application/json")
     try:
         # Example: Try to get the catalog to check Nessie connection
-        catalog = iceberg_service_instance.get_catalog()
+        catalog = await asyncio.to_thread(iceberg_service_instance.get_catalog)
         # You could also try listing namespaces or buckets for a deeper check
-        return {"status": "ok", "catalog_name": catalog.name}
+        health_response = dumps_json({"status": "ok", "catalog_name": catalog.name})
+        return Response(content=health_response, media_type="application/json")
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail=f"Service Unavailable: {e}")
 
 
+@app.post("/data/parquet")
+async def write_parquet_to_iceberg(request: Request):
+    """
+    Bulk write endpoint: the request body is a Parquet file (application/vnd.apache.parquet)
+    whose columns match the example table. Skips JSON parsing and per-row conversion.
+    """
+    try:
+        async with data_request_semaphore:
+            body = await request.body()
+            await asyncio.to_thread(nessie_service_instance.create_namespace, "default")
+            table = await asyncio.to_thread(
+                iceberg_service_instance.create_iceberg_table,
+                identifier=EXAMPLE_TABLE_IDENTIFIER,
+                schema=EXAMPLE_SCHEMA,
+                overwrite=False
+            )
+            try:
+                arrow_table = await asyncio.to_thread(iceberg_service_instance.decode_parquet, table, body)
+            except (pa.ArrowException, KeyError, ValueError) as e:
+                # Not valid Parquet, missing columns, or values that don't fit the table schema
+                raise HTTPException(status_code=400, detail=f"Invalid Parquet payload: {e}")
+            await asyncio.to_thread(iceberg_service_instance.append_arrow, table, arrow_table)
+            invalidate_data_cache()
+
+        return Response(content=WRITE_SUCCESS_RESPONSE, media_type="application/json")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error writing Parquet data to Iceberg: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to write data: {e}")
+
+@app.get("/data/arrow")
+async def read_arrow_from_iceberg(
+    columns: list[str] | None = Query(None),
+    filters: list[str] | None = Query(None, alias="filter"),
+    limit: int | None = Query(None, ge=1)
+):
+    """
+    Streams the example table as an Arrow IPC stream
+    (application/vnd.apache.arrow.stream) instead of JSON records.
+    Each batch is encoded off the event loop as it is read, so the full result is never held in memory.
+    """
+    selected_fields = tuple(columns) if columns else ("*",)
+    try:
+        row_filter = build_row_filter(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        reader, release = await open_batch_stream(row_filter, selected_fields, limit)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error reading Arrow data from Iceberg: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to read data: {e}")
+
+    async def ipc_chunks():
+        sink = io.BytesIO()
+        batches = iter(reader)
+
+        def drain() -> bytes:
+            chunk = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return chunk
+
+        def encode_next_batch() -> bytes | None:
+            batch = next(batches, None)
+            if batch is None:
+                return None
+            writer.write_batch(batch)
+            return drain()
+
+        try:
+            writer = pa.ipc.new_stream(sink, reader.schema)
+            yield drain()
+            while (chunk := await asyncio.to_thread(encode_next_batch)) is not None:
+                yield chunk
+            writer.close()
+            yield drain()
+        except Exception as e:
+            # Headers are already sent; log it so a truncated stream is traceable
+            logger.exception(f"Error streaming Arrow data from Iceberg: {e}")
+            raise
+        finally:
+            release()
+
+    return StreamingResponse(ipc_chunks(), media_type="application/vnd.apache.arrow.stream", background=BackgroundTask(release))
+
+@app.get("/data/stream")
+async def stream_data_from_iceberg(
+    columns: list[str] | None = Query(None),
+    filters: list[str] | None = Query(None, alias="filter"),
+    limit: int | None = Query(None, ge=1)
+):
+    """
+    Streams the example table as newline-delimited JSON (one record per line).
+    Each Arrow batch is read, converted and encoded with orjson in a worker thread,
+    so the full result is never held in memory and the event loop is never blocked on encoding.
+    """
+    selected_fields = tuple(columns) if columns else ("*",)
+    try:
+        row_filter = build_row_filter(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        reader, release = await open_batch_stream(row_filter, selected_fields, limit)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error reading data from Iceberg: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to read data: {e}")
+
+    async def ndjson_lines():
+        batches = iter(reader)
+
+        def encode_next_batch() -> bytes | None:
+            batch = next(batches, None)
+            if batch is None:
+                return None
+            return b"".join(dumps_json(record) + b"\n" for record in batch.to_pylist())
+
+        try:
+            while (chunk := await asyncio.to_thread(encode_next_batch)) is not None:
+                yield chunk
+        except Exception as e:
+            # Headers are already sent; log it so a truncated stream is traceable
+            logger.exception(f"Error streaming data from Iceberg: {e}")
+            raise
+        finally:
+            release()
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson", background=BackgroundTask(release))
+
 @app.post("/data/{item_id}")
 async def write_data_to_iceberg(item_id: str, value: float):
     """
     Example endpoint to write data to an Iceberg table.
     """
     try:
-        # 1. Ensure the namespace exists
-        # Access services via global instances
-        await nessie_service_instance.create_namespace("default")
-
-        # 2. Ensure the table exists (or create it)
-        table = await iceberg_service_instance.create_iceberg_table(
-            identifier=EXAMPLE_TABLE_IDENTIFIER,
-            schema=EXAMPLE_SCHEMA,
-            overwrite=False
-        )
+        async with data_request_semaphore:
+            # 1. Ensure the namespace exists
+            # Access services via global instances
+            await asyncio.to_thread(nessie_service_instance.create_namespace, "default")
+
+            # 2. Ensure the table exists (or create it)
+            table = await asyncio.to_thread(
+                iceberg_service_instance.create_iceberg_table,
+                identifier=EXAMPLE_TABLE_IDENTIFIER,
+                schema=EXAMPLE_SCHEMA,
+                overwrite=False
+            )
 
-        # 3. Prepare data
-        data_to_append = pd.DataFrame([{
-            "id": item_id,
-            "value": value,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc)
-        }])
+            # 3. Prepare data (typed against the table's Arrow schema, no DataFrame inference)
+            records_to_append = [{
+                "id": item_id,
+                "value": value,
+                "timestamp": datetime.datetime.now(datetime.timezone.utc)
+            }]
 
-        # 4. Append data
-        await iceberg_service_instance.append_data(table, data_to_append)
+            # 4. Append data
+            await asyncio.to_thread(iceberg_service_instance.append_records, table, records_to_append)
+            invalidate_data_cache()
 
-        return {"status": "success", "message": f"Data appended to {EXAMPLE_TABLE_IDENTIFIER}"}
+        return Response(content=WRITE_SUCCESS_RESPONSE, media_type="application/json")
     except Exception as e:
         logger.exception(f"Error writing data to Iceberg: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to write data: {e}")
 
 @app.get("/data")
-async def read_data_from_iceberg():
+async def read_data_from_iceberg(
+    request: Request,
+    columns: list[str] | None = Query(None),
+    filters: list[str] | None = Query(None, alias="filter"),
+    limit: int | None = Query(None, ge=1)
+):
     """
     Example endpoint to read data from an Iceberg table.
+    Optional `columns`, `filter` ("column:op:value", repeatable) and `limit`
+    are pushed down into the table scan.
+    Serialized (and gzipped) bodies are reused for DATA_RESPONSE_CACHE_TTL_SECONDS or until the next
+    write through this process; writes from other workers or processes are not seen until the entry expires.
     """
+    global data_response_cache_bytes
+    selected_fields = tuple(columns) if columns else ("*",)
     try:
-        table = await iceberg_service_instance.load_iceberg_table(EXAMPLE_TABLE_IDENTIFIER)
-        df = await iceberg_service_instance.read_data(table)
-        return {"data": df.to_dict(orient="records")}
+        row_filter = build_row_filter(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    cache_key = (selected_fields, tuple(filters or ()), limit)
+    cache_ttl = app_config.DATA_RESPONSE_CACHE_TTL_SECONDS
+    prune_data_cache(time.monotonic())
+    cached = data_response_cache.get(cache_key)
+    if cached is not None:
+        return data_body_response(request, cached[1], cached[2])
+
+    generation = data_generation
+    try:
+        async with data_request_semaphore:
+            table = await asyncio.to_thread(iceberg_service_instance.load_iceberg_table, EXAMPLE_TABLE_IDENTIFIER)
+            check_read_request(table, row_filter, selected_fields)
+            records = await asyncio.to_thread(
+                iceberg_service_instance.read_records,
+                table,
+                row_filter=row_filter,
+                selected_fields=selected_fields,
+                limit=limit
+            )
+            # Row conversion and encoding are CPU-bound for large results; keep them off the event loop
+            body, gzipped = await asyncio.to_thread(encode_data_response, records, cache_ttl > 0)
+        entry_bytes = len(body) + len(gzipped or b"")
+        if cache_ttl > 0 and generation == data_generation and entry_bytes <= app_config.DATA_RESPONSE_CACHE_MAX_BYTES:
+            previous = data_response_cache.pop(cache_key, None)
+            if previous is not None:
+                data_response_cache_bytes -= len(previous[1]) + len(previous[2] or b"")
+            data_response_cache[cache_key] = (time.monotonic(), body, gzipped)
+            data_response_cache_bytes += entry_bytes
+            prune_data_cache(time.monotonic())
+        return data_body_response(request, body, gzipped)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Error reading data from Iceberg: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to read data: {e}")
 
-# To run this file: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
-# Make sure your docker-compose services (Nessie, MinIO) are running.
\ No newline at end of file
+# To run this file: python -m app.main (uses the UVICORN_* settings from config)
+# or: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
+# Make sure your docker-compose services (Nessie, MinIO) are running.
+if __name__ == "__main__":
+    import uvicorn
+
+    settings = load_app_config()
+    # uvloop and httptools ship with uvicorn[standard]; pin them instead of relying on auto-detection
+    uvicorn.run(
+        "app.main:app",
+        host=settings.UVICORN_HOST,
+        port=settings.UVICORN_PORT,
+        reload=settings.UVICORN_RELOAD,
+        workers=settings.UVICORN_WORKERS,
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.UVICORN_ACCESS_LOG,
+        timeout_keep_alive=settings.UVICORN_TIMEOUT_KEEP_ALIVE
+    )
\ No newline at end of file
@@ -2,33 +2,53 @@
 
 from pyiceberg.catalog import Catalog
 from .nessie_service import NessieService
-from pyiceberg.exceptions import TableAlreadyExistsError, NoSuchTableError
+from pyiceberg.exceptions import TableAlreadyExistsError, NoSuchTableError, NoSuchNamespaceError
 from pyiceberg.schema import Schema, StructType, NestedField
 from pyiceberg.types import (
     LongType, StringType, TimestampType, DoubleType,
     FloatType, IntegerType, BooleanType, DateType, DecimalType,
     UUIDType
 )
-from pyiceberg.expressions import transforms
+from pyiceberg.expressions import AlwaysTrue, BooleanExpression
+from pyiceberg.expressions.visitors import bind
+from pyiceberg.partitioning import PartitionSpec, UNPARTITIONED_PARTITION_SPEC
 from pyiceberg.table import Table
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pandas as pd # For convenience in data preparation
+from collections import OrderedDict
 import logging
-
-# Assuming you have a config.py to load your pyiceberg.yaml configuration
-from ..config import AppConfig # Assuming AppConfig has nessie_catalog_name and pyiceberg_config_path
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 class IcebergService:
-    def __init__(self, nessie_service: NessieService):
+    def __init__(
+        self,
+        nessie_service: NessieService,
+        table_cache_size: int = 128,
+        table_cache_ttl_seconds: float = 30.0
+    ):
         """
         Initializes the IcebergService.
         :param nessie_service: An instance of NessieService to get the catalog.
+        :param table_cache_size: Maximum number of loaded tables kept in the LRU cache.
+        :param table_cache_ttl_seconds: How long a cached table handle is kept before it is reloaded.
         """
         self.nessie_service = nessie_service
         self._catalog: Catalog = None
+        self.table_cache_size = table_cache_size
+        self.table_cache_ttl_seconds = table_cache_ttl_seconds
+        # identifier -> (loaded_at monotonic time, Table). Handles are shared by readers and writers and
+        # never refreshed in place; a stale handle is dropped when it expires or when a commit through it fails.
+        self._tables: OrderedDict[str, tuple[float, Table]] = OrderedDict()
+        # Service methods are called from worker threads (asyncio.to_thread), so guard the cache
+        self._tables_lock = threading.Lock()
+        # Arrow schemas keyed by (table uuid, schema id) so conversions never re-infer types.
+        # The uuid (not the name) keeps a dropped-and-recreated table from reusing the old schema.
+        self._arrow_schemas: dict[tuple, pa.Schema] = {}
+        self._arrow_schemas_lock = threading.Lock()
 
     def get_catalog(self) -> Catalog:
         """Helper to get the PyIceberg catalog instance."""
@@ -36,11 +56,62 @@ class IcebergService:
             self._catalog = self.nessie_service.get_catalog()
         return self._catalog
 
+    @staticmethod
+    def _table_key(identifier: str | tuple[str]) -> str:
+        return identifier if isinstance(identifier, str) else ".".join(identifier)
+
+    def _get_cached_table(self, identifier: str | tuple[str]) -> Table | None:
+        key = self._table_key(identifier)
+        with self._tables_lock:
+            cached = self._tables.get(key)
+            if cached is None:
+                return None
+            loaded_at, table = cached
+            if time.monotonic() - loaded_at > self.table_cache_ttl_seconds:
+                del self._tables[key]
+                return None
+            self._tables.move_to_end(key)
+            return table
+
+    def _cache_table(self, identifier: str | tuple[str], table: Table):
+        key = self._table_key(identifier)
+        with self._tables_lock:
+            self._tables[key] = (time.monotonic(), table)
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.table_cache_size:
+                self._tables.popitem(last=False)
+
+    def _invalidate_table(self, identifier: str | tuple[str]):
+        with self._tables_lock:
+            self._tables.pop(self._table_key(identifier), None)
+
+    def _evict_table(self, table: Table):
+        # Drops every cache entry holding this Table object (Table.name() may include the catalog name)
+        with self._tables_lock:
+            for key in [key for key, (_, cached) in self._tables.items() if cached is table]:
+                del self._tables[key]
+
+    def get_arrow_schema(self, table: Table) -> pa.Schema:
+        """
+        Returns the Arrow schema for a table's current Iceberg schema.
+        The schema is converted once per schema version and reused for every append.
+        :param table: The PyIceberg Table object.
+        :return: The matching PyArrow Schema.
+        """
+        iceberg_schema = table.schema()
+        key = (table.metadata.table_uuid, iceberg_schema.schema_id)
+        with self._arrow_schemas_lock:
+            arrow_schema = self._arrow_schemas.get(key)
+            if arrow_schema is None:
+                arrow_schema = iceberg_schema.as_arrow()
+                self._arrow_schemas[key] = arrow_schema
+            return arrow_schema
+
     def create_iceberg_table(
         self,
         identifier: str | tuple[str],
         schema: Schema,
-        partition_spec: transforms.PartitionSpec | None = None,
+        partition_spec: PartitionSpec | None = None,
         properties: dict | None = None,
         location: str | None = None, # Optional: specifies exact location, otherwise uses warehouse + identifier
         overwrite: bool = False # If true, drops and recreates table if exists
@@ -55,6 +126,12 @@ class IcebergService:
         :param overwrite: If True, drops table if exists before creating.
         :return: The created or loaded Iceberg Table instance.
         """
+        if not overwrite:
+            # Already created or loaded by this service: skip the create round-trip
+            table = self._get_cached_table(identifier)
+            if table is not None:
+                return table
+
         catalog = self.get_catalog()
         full_properties = properties or {}
         # Set format version 2 for modern features if not specified
@@ -63,6 +140,7 @@ class IcebergService:
 
         try:
             if overwrite:
+                self._invalidate_table(identifier)
                 try:
                     catalog.drop_table(identifier)
                     logger.warning(f"Existing table '{identifier}' dropped for overwrite.")
@@ -75,15 +153,21 @@ class IcebergService:
             table = catalog.create_table(
                 identifier=identifier,
                 schema=schema,
-                partition_spec=partition_spec,
+                partition_spec=partition_spec or UNPARTITIONED_PARTITION_SPEC,
                 properties=full_properties,
                 location=location
             )
-            logger.info(f"Table '{identifier}' created successfully at location: {table.location}")
+            logger.info(f"Table '{identifier}' created successfully at location: {table.location()}")
+            self._cache_table(identifier, table)
             return table
         except TableAlreadyExistsError:
             logger.warning(f"Table '{identifier}' already exists. Loading existing table.")
-            return catalog.load_table(identifier)
+            return self.load_iceberg_table(identifier)
+        except NoSuchNamespaceError:
+            logger.error(f"Namespace for table '{identifier}' does not exist.")
+            # Dropped outside this service: make the next create_namespace call hit the catalog again
+            self.nessie_service.forget_namespace(Catalog.namespace_from(identifier))
+            raise
         except Exception as e:
             logger.error(f"Failed to create or load table '{identifier}': {e}")
             raise
@@ -91,13 +175,22 @@ class IcebergService:
     def load_iceberg_table(self, identifier: str | tuple[str]) -> Table:
         """
         Loads an existing Iceberg table.
+        Loaded tables are cached (LRU, expiring after table_cache_ttl_seconds) so repeated
+        requests reuse the same handle instead of fetching metadata from the catalog each time.
+        Appends through this service update the cached handle in place, but commits made by other
+        processes (Trino, other workers) are only picked up once the entry expires or a failed
+        commit evicts it, so reads may lag external writers by up to the TTL.
         :param identifier: Table identifier (e.g., "default.my_table").
         :return: The loaded Iceberg Table instance.
         """
+        table = self._get_cached_table(identifier)
+        if table is not None:
+            return table
         catalog = self.get_catalog()
         try:
             table = catalog.load_table(identifier)
             logger.info(f"Table '{identifier}' loaded successfully.")
+            self._cache_table(identifier, table)
             return table
         except NoSuchTableError:
             logger.error(f"Table '{identifier}' does not exist.")
@@ -114,15 +207,48 @@ class IcebergService:
                      The DataFrame schema should be compatible with the table's schema.
         """
         # Convert Pandas DataFrame to PyArrow Table
-        arrow_table = pa.Table.from_pandas(data, schema=table.schema().as_arrow(), preserve_index=False)
+        arrow_table = pa.Table.from_pandas(data, schema=self.get_arrow_schema(table), preserve_index=False)
+        self.append_arrow(table, arrow_table)
+
+    def append_records(self, table: Table, records: list[dict]):
+        """
+        Appends a list of row dictionaries to an Iceberg table.
+        Rows are converted straight into typed Arrow buffers using the table's cached
+        Arrow schema, skipping the Pandas DataFrame and its per-column type inference.
+        :param table: The PyIceberg Table object to append to.
+        :param records: Rows as dictionaries keyed by column name.
+        """
+        arrow_table = pa.Table.from_pylist(records, schema=self.get_arrow_schema(table))
+        self.append_arrow(table, arrow_table)
+
+    def decode_parquet(self, table: Table, data: bytes) -> pa.Table:
+        """
+        Decodes an in-memory Parquet file into an Arrow table matching the Iceberg table's schema.
+        :param table: The PyIceberg Table object the data is destined for.
+        :param data: Raw bytes of a Parquet file containing the table's columns.
+        :return: The decoded PyArrow Table, cast to the table's Arrow schema.
+        :raises pa.ArrowException, KeyError, ValueError: If the payload is not valid Parquet,
+                lacks one of the table's columns, or holds values that can't be cast.
+        """
+        arrow_schema = self.get_arrow_schema(table)
+        return pq.read_table(pa.BufferReader(data), columns=arrow_schema.names).cast(arrow_schema)
+
+    def append_arrow(self, table: Table, arrow_table: pa.Table):
+        """
+        Appends an Arrow table to an Iceberg table.
+        :param table: The PyIceberg Table object to append to.
+        :param arrow_table: A PyArrow Table compatible with the table's schema.
+        """
         # Note: PyIceberg's append currently works reliably for unpartitioned tables.
         # For partitioned tables, you might need specific versions or other tools.
         # Ensure your PyIceberg version (e.g., 0.6.0+) supports writes.
         try:
             table.append(arrow_table)
-            logger.info(f"Appended {len(data)} rows to table '{table.name}'.")
+            logger.info(f"Appended {arrow_table.num_rows} rows to table '{table.name()}'.")
         except Exception as e:
-            logger.error(f"Failed to append data to table '{table.name}': {e}")
+            logger.error(f"Failed to append data to table '{table.name()}': {e}")
+            # The cached handle may be stale (e.g. a concurrent commit elsewhere); reload it next time
+            self._evict_table(table)
             raise
 
     def read_data(self, table: Table) -> pd.DataFrame:
@@ -144,6 +270,107 @@ class IcebergService:
             logger.error(f"Failed to read data from table '{table.name}': {e}")
             raise
 
+    def validate_selected_fields(self, table: Table, selected_fields: tuple[str, ...]):
+        """
+        Checks that every requested column exists in the table's current schema,
+        so a bad projection can be reported to the caller instead of failing inside the scan.
+        :param table: The PyIceberg Table object to be scanned.
+        :param selected_fields: Columns to read; ("*",) selects all columns.
+        :raises ValueError: If any of the columns is not in the table's schema.
+        """
+        if "*" in selected_fields:
+            return
+        schema = table.schema()
+        unknown = []
+        for name in selected_fields:
+            try:
+                schema.find_field(name)
+            except ValueError:
+                unknown.append(name)
+        if unknown:
+            raise ValueError(f"Unknown column(s): {', '.join(unknown)}.")
+
+    def validate_row_filter(self, table: Table, row_filter: BooleanExpression):
+        """
+        Binds a row filter against the table's current schema, which resolves its column names
+        and converts its literals to the column types, so bad filters are caught before the scan.
+        :param table: The PyIceberg Table object to be scanned.
+        :param row_filter: The PyIceberg row filter expression.
+        :raises ValueError: If a column is unknown or a value can't be converted to the column's type.
+        """
+        bind(table.schema(), row_filter, case_sensitive=True)
+
+    def read_records(
+        self,
+        table: Table,
+        row_filter: str | BooleanExpression = AlwaysTrue(),
+        selected_fields: tuple[str, ...] = ("*",),
+        limit: int | None = None
+    ) -> list[dict]:
+        """
+        Reads data from an Iceberg table as a list of row dictionaries.
+        Rows are built from the Arrow scan result in C++ (Table.to_pylist), avoiding
+        the per-cell Python conversion of DataFrame.to_dict(orient="records").
+        The filter and projection are pushed down into the scan, so data files are
+        pruned using manifest/Parquet column statistics and only the selected
+        columns are decoded.
+        :param table: The PyIceberg Table object to read from.
+        :param row_filter: Optional row filter expression (string or PyIceberg expression).
+        :param selected_fields: Columns to read; defaults to all columns.
+        :param limit: Optional maximum number of rows to return.
+        :return: A list of rows keyed by column name.
+        """
+        return self.read_arrow(table, row_filter, selected_fields, limit).to_pylist()
+
+    def read_arrow(
+        self,
+        table: Table,
+        row_filter: str | BooleanExpression = AlwaysTrue(),
+        selected_fields: tuple[str, ...] = ("*",),
+        limit: int | None = None
+    ) -> pa.Table:
+        """
+        Reads data from an Iceberg table into a PyArrow Table.
+        Accepts the same pushdown arguments as read_records.
+        :param table: The PyIceberg Table object to read from.
+        :param row_filter: Optional row filter expression (string or PyIceberg expression).
+        :param selected_fields: Columns to read; defaults to all columns.
+        :param limit: Optional maximum number of rows to return.
+        :return: A PyArrow Table with the scanned rows.
+        """
+        try:
+            scan = table.scan(row_filter=row_filter, selected_fields=selected_fields, limit=limit)
+            arrow_table = scan.to_arrow()
+            logger.info(f"Read {arrow_table.num_rows} rows from table '{table.name()}'.")
+            return arrow_table
+        except Exception as e:
+            logger.error(f"Failed to read data from table '{table.name()}': {e}")
+            raise
+
+    def read_batches(
+        self,
+        table: Table,
+        row_filter: str | BooleanExpression = AlwaysTrue(),
+        selected_fields: tuple[str, ...] = ("*",),
+        limit: int | None = None
+    ) -> pa.RecordBatchReader:
+        """
+        Opens a streaming scan over an Iceberg table.
+        Batches are produced lazily, so callers can forward rows without
+        materializing the whole result in memory.
+        :param table: The PyIceberg Table object to read from.
+        :param row_filter: Optional row filter expression (string or PyIceberg expression).
+        :param selected_fields: Columns to read; defaults to all columns.
+        :param limit: Optional maximum number of rows to return.
+        :return: A PyArrow RecordBatchReader over the scanned rows.
+        """
+        try:
+            scan = table.scan(row_filter=row_filter, selected_fields=selected_fields, limit=limit)
+            return scan.to_arrow_batch_reader()
+        except Exception as e:
+            logger.error(f"Failed to open batch reader for table '{table.name()}': {e}")
+            raise
+
     def evolve_table_schema(self, table: Table, new_schema_fields: dict, method: str = "add_columns"):
         """
         Evolves the schema of an Iceberg table.
@@ -171,6 +398,7 @@ class IcebergService:
         :param identifier: Table identifier (e.g., "default.my_table").
         """
         catalog = self.get_catalog()
+        self._invalidate_table(identifier)
         try:
             catalog.drop_table(identifier)
             logger.info(f"Table '{identifier}' dropped successfully.")
@@ -205,13 +433,11 @@ if __name__ == "__main__":
 
     # Define a simple schema
     event_schema = Schema(
-        StructType(
-            NestedField(1, "event_id", StringType(), required=True),
-            NestedField(2, "user_id", StringType(), required=True),
-            NestedField(3, "event_timestamp", TimestampType(), required=True),
-            NestedField(4, "event_type", StringType(), required=False),
-            NestedField(5, "value", DoubleType(), required=False)
-        )
+        NestedField(1, "event_id", StringType(), required=True),
+        NestedField(2, "user_id", StringType(), required=True),
+        NestedField(3, "event_timestamp", TimestampType(), required=True),
+        NestedField(4, "event_type", StringType(), required=False),
+        NestedField(5, "value", DoubleType(), required=False)
     )
 
     try:
@@ -224,7 +450,7 @@ if __name__ == "__main__":
         table = iceberg_svc.create_iceberg_table(
             identifier=test_table_name,
             schema=event_schema,
-            # For partitioning: partition_spec=transforms.LocalDayTransform(field_id=3, source_id=3),
+            # For partitioning: partition_spec=PartitionSpec(PartitionField(source_id=3, field_id=1000, transform=DayTransform(), name="event_day")),
             overwrite=True # Good for testing to start fresh
         )
         print(f"Table schema: {table.schema()}")
@@ -1,7 +1,7 @@
 # app/services/nessie_service.py
 
 from pyiceberg.catalog import Catalog, load_catalog
-from pyiceberg.exceptions import NoSuchTableError, TableAlreadyExistsError, NoSuchNamespaceError
+from pyiceberg.exceptions import NoSuchTableError, TableAlreadyExistsError, NoSuchNamespaceError, NamespaceAlreadyExistsError
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,9 @@ class NessieService:
         self.catalog_name = catalog_name
         self.config_file_path = config_file_path
         self._catalog = None
+        # Namespaces known to exist (as identifier tuples), so repeated create calls skip the catalog round-trip.
+        # Entries are dropped via forget_namespace when the catalog reports the namespace missing.
+        self._known_namespaces: set[tuple[str, ...]] = set()
 
     def get_catalog(self) -> Catalog:
         """
@@ -45,16 +48,29 @@ class NessieService:
         Creates a new namespace in the catalog.
         :param namespace_identifier: The name of the namespace (e.g., "my_db" or ("my_db", "staging")).
         """
+        namespace_key = Catalog.identifier_to_tuple(namespace_identifier)
+        if namespace_key in self._known_namespaces:
+            return
         catalog = self.get_catalog()
         try:
             catalog.create_namespace(namespace_identifier)
             logger.info(f"Namespace '{namespace_identifier}' created successfully.")
-        except TableAlreadyExistsError: # PyIceberg uses this for namespace too sometimes
+            self._known_namespaces.add(namespace_key)
+        except (TableAlreadyExistsError, NamespaceAlreadyExistsError): # PyIceberg uses TableAlreadyExistsError for namespace too sometimes
             logger.warning(f"Namespace '{namespace_identifier}' already exists.")
+            self._known_namespaces.add(namespace_key)
         except Exception as e:
             logger.error(f"Failed to create namespace '{namespace_identifier}': {e}")
             raise
 
+    def forget_namespace(self, namespace_identifier: str | tuple[str]) -> None:
+        """
+        Drops a namespace from the known-namespaces set, e.g. after it was removed outside this service,
+        so the next create_namespace call goes back to the catalog.
+        :param namespace_identifier: The name of the namespace.
+        """
+        self._known_namespaces.discard(Catalog.identifier_to_tuple(namespace_identifier))
+
     def list_tables(self, namespace_identifier: str | tuple[str]) -> list[tuple[str]]:
         """
         Lists all tables within a given namespace.
@@ -0,0 +1,187 @@
+# app/utils/helpers.py
+
+import base64
+import logging
+import queue
+import threading
+from decimal import Decimal
+from functools import reduce
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pyiceberg.expressions import (
+    AlwaysTrue, And, BooleanExpression,
+    EqualTo, NotEqualTo, GreaterThan, GreaterThanOrEqual, LessThan, LessThanOrEqual
+)
+
+# REST filter operator -> PyIceberg expression constructor.
+# Built once at import so each filter is a single dict lookup instead of an if/elif chain.
+ROW_FILTER_OPS = {
+    "eq": EqualTo,
+    "ne": NotEqualTo,
+    "gt": GreaterThan,
+    "gte": GreaterThanOrEqual,
+    "lt": LessThan,
+    "lte": LessThanOrEqual,
+}
+
+
+def build_row_filter(filters: list[str] | None) -> BooleanExpression:
+    """
+    Converts REST filter strings of the form "column:op:value" into a single
+    PyIceberg row filter (all conditions ANDed) that can be pushed down into a table scan.
+    Values are passed as string literals; column names and values are only checked when the
+    expression is bound to a table schema (IcebergService.validate_row_filter).
+    :param filters: Filter strings, e.g. ["id:eq:abc", "value:gt:1.5"].
+    :return: The combined BooleanExpression, or AlwaysTrue() when no filters are given.
+    :raises ValueError: If a filter string is malformed or uses an unknown operator.
+    """
+    if not filters:
+        return AlwaysTrue()
+
+    expressions = []
+    for raw_filter in filters:
+        column, sep, rest = raw_filter.partition(":")
+        op, sep2, value = rest.partition(":")
+        if not (sep and sep2 and column):
+            raise ValueError(f"Invalid filter '{raw_filter}', expected 'column:op:value'.")
+        expression_cls = ROW_FILTER_OPS.get(op)
+        if expression_cls is None:
+            raise ValueError(f"Unsupported filter operator '{op}'. Supported: {', '.join(ROW_FILTER_OPS)}.")
+        expressions.append(expression_cls(column, value))
+
+    return reduce(And, expressions)
+
+
+# Shared orjson options for API payloads: numpy scalars/arrays and datetimes are encoded in C,
+# and naive timestamps (Iceberg TimestampType) are rendered as UTC with a "Z" suffix.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj: Any) -> Any:
+    """Fallback for the Arrow/Iceberg value types orjson doesn't encode natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encodes an API payload with the shared orjson options."""
+    return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class LakehouseJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by orjson with the shared options and fallback for Iceberg value types.
+    Return it directly from routes: a plain dict return value still goes through jsonable_encoder first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+class BatchingStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that buffers formatted records and writes them out in one write and one flush,
+    either once batch_size records are buffered or every flush_interval seconds (from a background thread).
+    Meant to sit behind a QueueListener, so request threads never touch the stream.
+    """
+
+    def __init__(self, stream=None, batch_size: int = 100, flush_interval: float = 0.1):
+        super().__init__(stream)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._last_record: logging.LogRecord | None = None
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self.lock:
+            self._buffer.append(message)
+            self._last_record = record
+            if len(self._buffer) >= self.batch_size:
+                self._write_buffer()
+
+    def flush(self):
+        with self.lock:
+            self._write_buffer()
+
+    def close(self):
+        self._closing.set()
+        self._flusher.join()
+        self.flush()
+        super().close()
+
+    def _flush_periodically(self):
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def _write_buffer(self):
+        # Called with self.lock held
+        if not self._buffer:
+            return
+        text = self.terminator.join(self._buffer) + self.terminator
+        self._buffer.clear()
+        try:
+            self.stream.write(text)
+            self.stream.flush()
+        except Exception:
+            self.handleError(self._last_record)
+
+
+class LoggingQueueListener(QueueListener):
+    """
+    QueueListener whose stop() also detaches its QueueHandler from the root logger and closes
+    its handlers, so pending batches are written and restarting doesn't stack handlers.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, queue_handler: QueueHandler, *handlers: logging.Handler):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+
+    def stop(self):
+        # Detach first so nothing is enqueued after the listener's sentinel
+        logging.getLogger().removeHandler(self.queue_handler)
+        super().stop()
+        for handler in self.handlers:
+            handler.close()
+
+
+def start_queue_logging(
+    level: str = "INFO",
+    stream=None,
+    batch_size: int = 100,
+    flush_interval: float = 0.1
+) -> QueueListener:
+    """
+    Routes root logging through a QueueHandler so request handlers only enqueue records;
+    a single listener thread formats them and a BatchingStreamHandler writes them in batches.
+    :param level: Root log level name (e.g. "INFO").
+    :param stream: Stream to write to; defaults to stderr.
+    :param batch_size: Records buffered before a write is forced.
+    :param flush_interval: Seconds between writes of a partial batch.
+    :return: The started listener; call stop() on shutdown to flush pending records and detach the handler.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = BatchingStreamHandler(stream, batch_size=batch_size, flush_interval=flush_interval)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    queue_handler = QueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(queue_handler)
+
+    listener = LoggingQueueListener(log_queue, queue_handler, stream_handler)
+    listener.start()
+    return listener
@@ -0,0 +1,83 @@
+# tests/test_helpers.py
+
+import io
+import logging
+import time
+from logging.handlers import QueueHandler
+
+import pytest
+
+from app.utils.helpers import start_queue_logging
+
+
+class RecordingStream(io.StringIO):
+    """StringIO that also remembers each write, so batching is observable."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
+@pytest.fixture
+def root_level():
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    yield
+    root_logger.setLevel(level)
+
+
+def queue_handlers() -> list[logging.Handler]:
+    return [handler for handler in logging.getLogger().handlers if isinstance(handler, QueueHandler)]
+
+
+def test_queue_logging_respects_levels(root_level):
+    stream = RecordingStream()
+    listener = start_queue_logging("INFO", stream=stream, flush_interval=60)
+    listener.handlers[0].setLevel(logging.WARNING)
+    logger = logging.getLogger("tests.levels")
+
+    logger.debug("below root level")
+    logger.info("below handler level")
+    logger.warning("kept")
+    listener.stop()
+
+    output = stream.getvalue()
+    assert "kept" in output
+    assert "below" not in output
+
+
+def test_queue_logging_writes_full_batches_and_drains_on_stop(root_level):
+    stream = RecordingStream()
+    listener = start_queue_logging("INFO", stream=stream, batch_size=3, flush_interval=60)
+    logger = logging.getLogger("tests.batches")
+
+    for i in range(7):
+        logger.info("message %d", i)
+    listener.stop()
+
+    assert [write.count("\n") for write in stream.writes] == [3, 3, 1]
+    assert [line.rsplit(" ", 1)[-1] for line in stream.getvalue().splitlines()] == [str(i) for i in range(7)]
+    assert queue_handlers() == []
+
+
+def test_queue_logging_flushes_partial_batch_after_interval(root_level):
+    stream = RecordingStream()
+    listener = start_queue_logging("INFO", stream=stream, batch_size=100, flush_interval=0.05)
+    try:
+        logging.getLogger("tests.interval").info("lonely")
+        deadline = time.monotonic() + 2
+        while not stream.writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "lonely" in stream.getvalue()
+    finally:
+        listener.stop()
+
+
+def test_queue_logging_restart_does_not_stack_handlers(root_level):
+    for _ in range(3):
+        start_queue_logging("INFO", stream=RecordingStream(), flush_interval=60).stop()
+    assert queue_handlers() == []